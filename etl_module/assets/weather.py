@@ -1,8 +1,83 @@
+import asyncio
+from zoneinfo import ZoneInfo
+
+import aiohttp
 from etl_module.connectors.weather_api import WeatherApiClient
 from etl_module.connectors.mysql import MySqlClient
 import pandas as pd
 from sqlalchemy import MetaData, Table, Column, String, DateTime, Integer, Float
 
+# 한국 표준시 타임존 객체 (호출마다 다시 만들지 않도록 모듈 수준에 캐시)
+_KST = ZoneInfo("Asia/Seoul")
+
+# 테이블 정의는 프로세스당 한 번만 구성합니다.
+# 호출마다 MetaData/Table 객체를 다시 만들면 동일한 정의를 반복 생성할 뿐 아니라
+# MySqlClient의 create_table 캐시도 활용할 수 없습니다.
+metadata = MetaData()
+daily_weather_table = Table(
+    "daily_weather",
+    metadata,
+    Column("dt", String(8), nullable=False, primary_key=True),
+    Column("time", String(6), nullable=False, primary_key=True),
+    Column("measured_at", DateTime, nullable=False),
+    Column("id", Integer, primary_key=True),
+    Column("city", String(100), nullable=True),
+    Column("temperature", Float, nullable=True),
+    Column("humidity", Integer, nullable=True),
+    Column("wind_speed", Float, nullable=True),
+)
+
+
+async def extract_weather_async(
+    weather_api_client: WeatherApiClient, cities: list = ["Seoul", "Busan"]
+) -> pd.DataFrame:
+    """
+    여러 도시의 날씨 데이터를 추출합니다. (이벤트 루프 위에서 실행되는 버전)
+
+    모든 도시 요청을 `asyncio.gather`로 동시에 보내므로 전체 소요 시간이
+    도시 수에 비례하지 않고 가장 느린 응답 한 건의 시간으로 수렴합니다.
+
+    Parameters:
+    - weather_api_client (WeatherApiClient): API에서 날씨 데이터를 가져오기 위한 클라이언트.
+    - cities (list): 날씨 정보를 조회할 도시 이름 목록.
+
+    Returns:
+    - pd.DataFrame: 지정된 도시들의 날씨 데이터를 포함하는 DataFrame.
+      사용할 6개 필드(dt, id, city, temperature, humidity, wind_speed)만 담습니다.
+    """
+    # 하나의 세션(커넥션 풀)을 모든 요청이 공유합니다.
+    async with aiohttp.ClientSession() as session:
+        tasks = [
+            weather_api_client.get_city_async(session=session, city_name=city_name)
+            for city_name in cities
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    # 응답을 받는 즉시 실제로 쓰는 6개 필드만 투영하여 미리 크기를 잡은 리스트에
+    # 담습니다. 원본 JSON 트리는 투영 직후 버려지므로 추출 단계의 피크 메모리가
+    # 도시 수 x 전체 응답 트리가 아니라 도시 수 x 6개 값으로 줄어듭니다.
+    records = [None] * len(cities)
+    for i, (city_name, result) in enumerate(zip(cities, results)):
+        if isinstance(result, BaseException):
+            raise Exception(
+                f"{city_name} 도시의 날씨 데이터 추출에 실패했습니다. 오류: {result}"
+            )
+        records[i] = (
+            result["dt"],
+            result["id"],
+            result["name"],
+            result["main"]["temp"],
+            result["main"]["humidity"],
+            result["wind"]["speed"],
+        )
+    del results  # 원본 응답 트리를 GC 대상으로 만듭니다.
+
+    df = pd.DataFrame(
+        records,
+        columns=["dt", "id", "city", "temperature", "humidity", "wind_speed"],
+    )
+    return df
+
 
 def extract_weather(
     weather_api_client: WeatherApiClient, cities: list = ["Seoul", "Busan"]
@@ -10,18 +85,20 @@ def extract_weather(
     """
     여러 도시의 날씨 데이터를 추출합니다.
 
+    이벤트 루프 밖의 동기 코드를 위한 래퍼로, `extract_weather_async`를
+    `asyncio.run`으로 실행합니다. 이미 루프 위에 있다면
+    `extract_weather_async`를 직접 await 하세요.
+
     Parameters:
     - weather_api_client (WeatherApiClient): API에서 날씨 데이터를 가져오기 위한 클라이언트.
+    - cities (list): 날씨 정보를 조회할 도시 이름 목록.
 
     Returns:
     - pd.DataFrame: 지정된 도시들의 날씨 데이터를 포함하는 DataFrame.
     """
-    cities = ["Busan", "Seoul"]
-    weather_data = []
-    for city_name in cities:
-        weather_data.append(weather_api_client.get_city(city_name=city_name))
-    df = pd.json_normalize(weather_data)
-    return df
+    return asyncio.run(
+        extract_weather_async(weather_api_client=weather_api_client, cities=cities)
+    )
 
 
 def transform_weather(df: pd.DataFrame) -> pd.DataFrame:
@@ -29,34 +106,40 @@ def transform_weather(df: pd.DataFrame) -> pd.DataFrame:
     날씨 데이터를 변환하고 전처리합니다.
 
     Parameters:
-    - df (pd.DataFrame): 원본 날씨 데이터를 포함하는 DataFrame.
+    - df (pd.DataFrame): extract_weather가 만든 원본 날씨 데이터를 포함하는 DataFrame.
 
     Returns:
-    - pd.DataFrame: 선택된 컬럼과 이름이 변경된 데이터로 구성된 변환된 DataFrame.
+    - pd.DataFrame: 날짜/시간 컬럼이 추가되고 적재 순서로 정렬된 변환된 DataFrame.
     """
-    df["measured_at"] = pd.to_datetime(df["dt"], unit="s") + pd.Timedelta(
-        hours=9
-    )  # 한국시간
-    df["dt"] = df["measured_at"].dt.strftime("%Y%m%d")  # 기준년월일 (YYYYMMDD)
-    df["time"] = df["measured_at"].dt.strftime("%H%M%S")  # 기준년월일 (HHHHMMSS)
-    df_selected = df[
-        [
-            "dt",
-            "time",
-            "measured_at",
-            "id",
-            "name",
-            "main.temp",
-            "main.humidity",
-            "wind.speed",
-        ]
-    ]
-    df_selected = df_selected.rename(  # 컬럼명 수정
-        columns={
-            "name": "city",
-            "main.temp": "temperature",
-            "main.humidity": "humidity",
-            "wind.speed": "wind_speed",
+    # 한국시간: UTC로 해석한 뒤 타임존 변환(C 레벨 벡터 연산)하고,
+    # MySQL DATETIME 컬럼에 맞게 tz 정보를 제거합니다.
+    measured_at = (
+        pd.to_datetime(df["dt"], unit="s", utc=True)
+        .dt.tz_convert(_KST)
+        .dt.tz_localize(None)
+    )
+    # strftime은 행마다 파이썬 레벨 포맷팅을 수행하므로, C 레벨에서 동작하는
+    # 정수 연산(.dt.year 등)으로 날짜/시간 문자열을 만듭니다.
+    measured = measured_at.dt
+
+    # 최종 프레임을 한 번의 생성으로 구성합니다. 원본 df에 컬럼을 추가한 뒤
+    # 다시 선택하는 방식과 달리 중간 프레임 복사가 없고, 원본은 반환 즉시
+    # GC 대상이 됩니다. dtype도 이 시점에 메모리 최적 타입으로 좁혀
+    # 드라이버의 행 단위 타입 변환 비용을 낮춥니다.
+    df_selected = pd.DataFrame(
+        {
+            "dt": (measured.year * 10000 + measured.month * 100 + measured.day).astype(
+                str
+            ),  # 기준년월일 (YYYYMMDD)
+            "time": (measured.hour * 10000 + measured.minute * 100 + measured.second)
+            .astype(str)
+            .str.zfill(6),  # 기준시각 (HHMMSS)
+            "measured_at": measured_at,
+            "id": df["id"].astype("int32"),
+            "city": df["city"].astype("category"),
+            "temperature": df["temperature"].astype("float32"),
+            "humidity": df["humidity"].astype("uint8"),
+            "wind_speed": df["wind_speed"].astype("float32"),
         }
     )
     return df_selected
@@ -75,19 +158,7 @@ def load_weather(
     - my_sql_client (MySqlClient): 데이터베이스 클라이언트
     - method (str, optional): 삽입 방법 ('insert', 'upsert', 'overwrite')
     """
-    metadata = MetaData()
-    table = Table(
-        "daily_weather",
-        metadata,
-        Column("dt", String(8), nullable=False, primary_key=True),
-        Column("time", String(6), nullable=False, primary_key=True),
-        Column("measured_at", DateTime, nullable=False),
-        Column("id", Integer, primary_key=True),
-        Column("city", String(100), nullable=True),
-        Column("temperature", Float, nullable=True),
-        Column("humidity", Integer, nullable=True),
-        Column("wind_speed", Float, nullable=True),
-    )
+    table = daily_weather_table
     if method == "insert":
         my_sql_client.insert(df=df, table=table, metadata=metadata)
     elif method == "upsert":
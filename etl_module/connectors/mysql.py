@@ -1,8 +1,19 @@
+import os
+import tempfile
+from operator import itemgetter
+
 from sqlalchemy import create_engine, MetaData, Table, MetaData, Column
 from sqlalchemy import text
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.engine import URL
 import pandas as pd
 
+# to_sql 배치 삽입 시 한 번의 multi-VALUES INSERT에 담을 최대 행 수
+CHUNKSIZE = 10000
+
+# 이 행 수 이상이면 multi-VALUES INSERT 대신 LOAD DATA LOCAL INFILE을 사용
+BULK_LOAD_THRESHOLD = 1000
+
 
 class MySqlClient:
     """
@@ -38,16 +49,53 @@ class MySqlClient:
         )
 
         # SQLAlchemy 엔진 생성
-        self.engine = create_engine(connection_url)
+        # allow_local_infile: 대용량 적재 시 LOAD DATA LOCAL INFILE을 허용
+        # pool_pre_ping/pool_recycle: 스케줄 주기 사이에 유휴 상태였던 커넥션을
+        # MySQL wait_timeout에 걸리기 전에 검증/갱신하여 재사용할 수 있게 합니다.
+        self.engine = create_engine(
+            connection_url,
+            connect_args={"allow_local_infile": True},
+            pool_size=5,
+            max_overflow=5,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+        )
+
+        # create_all이 이미 수행된 테이블 이름 집합.
+        # 스케줄러가 주기적으로 같은 테이블에 적재할 때 매번 information_schema를
+        # 조회하는 존재 여부 확인 왕복을 건너뛰기 위한 캐시입니다.
+        self._created: set = set()
 
     def create_table(self, metadata: MetaData) -> None:
         """
         주어진 메타데이터 객체를 기반으로 테이블을 생성합니다.
 
+        동일한 메타데이터의 테이블이 이 클라이언트로 이미 생성된 경우
+        추가 왕복 없이 바로 반환합니다.
+
         Parameters:
         - metadata (MetaData): 테이블 정의를 포함하는 SQLAlchemy MetaData 객체.
         """
+        table_names = set(metadata.tables)
+        if table_names <= self._created:
+            return
         metadata.create_all(self.engine)
+        self._created |= table_names
+
+    def _quote(self, identifier: str) -> str:
+        """
+        테이블/컬럼 이름을 MySQL 식별자 규칙에 맞게 인용(quote)합니다.
+
+        값이 아닌 식별자는 바인드 파라미터로 전달할 수 없으므로, f-string으로
+        SQL에 삽입되는 이름은 반드시 이 메서드를 거쳐 검증/인용합니다.
+
+        Parameters:
+        - identifier (str): 인용할 테이블 또는 컬럼 이름.
+
+        Returns:
+        - str: 인용된 식별자 문자열.
+        """
+        return self.engine.dialect.identifier_preparer.quote(identifier)
 
     def drop_table(self, table: Table) -> None:
         """
@@ -57,24 +105,76 @@ class MySqlClient:
         - table_name (str): 삭제할 테이블의 이름.
         """
         with self.engine.connect() as connection:
-            connection.execute(text(f"DROP TABLE IF EXISTS {table.name}"))
+            connection.execute(text(f"DROP TABLE IF EXISTS {self._quote(table.name)}"))
+        # 삭제된 테이블은 다음 create_table 호출 시 다시 생성되어야 합니다.
+        self._created.discard(table.name)
 
     def insert(self, df: pd.DataFrame, table: Table, metadata: MetaData) -> None:
         """
         주어진 DataFrame을 테이블에 삽입합니다. 테이블이 존재하지 않으면 생성합니다.
 
+        `method="multi"` + `chunksize=CHUNKSIZE`로 여러 행을 하나의
+        multi-VALUES INSERT 문으로 묶어 전송하므로, 행마다 INSERT를 보내는
+        기본 경로보다 왕복 횟수와 파싱 비용이 크게 줄어듭니다.
+
         Parameters:
         - df (pd.DataFrame): 삽입할 데이터를 포함하는 Pandas DataFrame.
         - table (Table): 데이터 삽입을 위한 SQLAlchemy Table 객체.
         - metadata (MetaData): 테이블 정의를 포함하는 SQLAlchemy MetaData 객체.
         """
         self.create_table(metadata=metadata)
-        df.to_sql(name=table.name, con=self.engine, if_exists="append", index=False)
+        if len(df) >= BULK_LOAD_THRESHOLD:
+            # 대용량 프레임은 SQL 파서를 우회하는 LOAD DATA 경로가 더 빠릅니다.
+            self._bulk_load(df=df, table=table)
+            return
+        df.to_sql(
+            name=table.name,
+            con=self.engine,
+            if_exists="append",
+            index=False,
+            method="multi",
+            chunksize=CHUNKSIZE,
+        )
+
+    def _bulk_load(self, df: pd.DataFrame, table: Table) -> None:
+        """
+        DataFrame을 `LOAD DATA LOCAL INFILE`로 테이블에 적재합니다.
+
+        탭 구분 CSV를 임시 파일로 직렬화한 뒤 클라이언트 측에서 서버로
+        스트리밍합니다. 행마다 SQL을 파싱하는 INSERT 경로와 달리 스토리지
+        엔진으로 바로 흘러 들어가므로 대용량 적재에서 훨씬 빠릅니다.
+
+        Parameters:
+        - df (pd.DataFrame): 적재할 데이터를 포함하는 Pandas DataFrame.
+        - table (Table): 데이터를 적재할 SQLAlchemy Table 객체.
+        """
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".tsv", delete=False, newline=""
+        ) as buffer:
+            tmp_path = buffer.name
+            df.to_csv(buffer, index=False, header=False, sep="\t", na_rep="\\N")
+        try:
+            columns = ", ".join(self._quote(column) for column in df.columns)
+            load_sql = (
+                f"LOAD DATA LOCAL INFILE '{tmp_path}' "
+                f"INTO TABLE {self._quote(table.name)} "
+                "FIELDS TERMINATED BY '\\t' "
+                "LINES TERMINATED BY '\\n' "
+                f"({columns})"
+            )
+            with self.engine.begin() as connection:
+                connection.exec_driver_sql(load_sql)
+        finally:
+            os.remove(tmp_path)
 
     def upsert(self, df: pd.DataFrame, table: Table, metadata: MetaData) -> None:
         """
         주어진 DataFrame 데이터를 테이블에 삽입하고, 기존 레코드가 있으면 갱신합니다.
 
+        단일 `INSERT ... ON DUPLICATE KEY UPDATE` 문을 파라미터 바인딩으로 실행하므로
+        DELETE + INSERT 두 번의 왕복과 리터럴 SQL 조립(인젝션 위험) 없이
+        한 번의 배치 실행으로 업서트가 완료됩니다.
+
         Parameters:
         - df (pd.DataFrame): 삽입 또는 갱신할 데이터를 포함하는 Pandas DataFrame.
         - table (Table): 업서트 작업을 수행할 SQLAlchemy Table 객체.
@@ -84,44 +184,73 @@ class MySqlClient:
 
         # 데이터프레임을 레코드(딕셔너리 목록)으로 변환
         data = df.to_dict(orient="records")
+        if not data:
+            return
 
         # 테이블의 고유 키(Primary Key) 추출
         key_columns = [
             pk_column.name for pk_column in table.primary_key.columns.values()
         ]
-        key_values = [tuple(row[pk] for pk in key_columns) for row in data]
-        delete_values = ", ".join(
-            [f"({', '.join(map(repr, values))})" for values in key_values]
+
+        # PK가 중복된 레코드(재시도, 배치 병합 등)를 제거합니다.
+        # 같은 키가 여러 번 오면 마지막 레코드만 유지하여 불필요한 파라미터와
+        # 서버 측 중복 갱신을 없앱니다.
+        # itemgetter는 행마다 제너레이터를 만드는 대신 C 레벨 호출 한 번으로
+        # 키 튜플을 뽑습니다. (키가 하나면 스칼라를 반환하므로 튜플로 감쌉니다.)
+        if len(key_columns) > 1:
+            get_key = itemgetter(*key_columns)
+        else:
+            get_key = lambda row, key=key_columns[0]: (row[key],)
+        deduplicated = {get_key(row): row for row in data}
+        data = list(deduplicated.values())
+
+        # PK 충돌 시 나머지 컬럼을 새 값으로 갱신
+        stmt = mysql_insert(table)
+        stmt = stmt.on_duplicate_key_update(
+            {
+                column.name: stmt.inserted[column.name]
+                for column in table.columns
+                if column.name not in key_columns
+            }
         )
 
-        with self.engine.connect() as connection:
-            if key_values:
-                delete_sql = f"""
-                    DELETE FROM {self.database_name}.{table.name}
-                    WHERE ({', '.join(key_columns)}) IN (
-                        {delete_values}
-                    )
-                """
-                connection.execute(text(delete_sql))
-                connection.commit()  # DELETE 문 실행
-
-        # 변환된 데이터프레임을 테이블에 추가 (INSERT)
-        df.to_sql(name=table.name, con=self.engine, if_exists="append", index=False)
-
-    def overwrite(self, df: pd.DataFrame, table: Table, metadata: MetaData) -> None:
+        # 업서트 전체를 하나의 트랜잭션으로 묶어 커밋(fsync)을 한 번만 수행하고,
+        # 실패 시 부분 반영 없이 롤백되도록 보장합니다.
+        # 드라이버의 파라미터 개수 제한을 넘지 않도록 CHUNKSIZE 단위로 나눠 실행합니다.
+        with self.engine.begin() as connection:
+            for start in range(0, len(data), CHUNKSIZE):
+                connection.execute(stmt, data[start : start + CHUNKSIZE])
+
+    def overwrite(
+        self,
+        df: pd.DataFrame,
+        table: Table,
+        metadata: MetaData,
+        recreate: bool = False,
+    ) -> None:
         """
         주어진 DataFrame 데이터를 테이블의 기존 데이터를 모두 대체하도록 삽입합니다.
 
+        기본 동작은 `TRUNCATE TABLE`로 기존 데이터만 비우는 것입니다.
+        DROP + CREATE와 달리 스키마/인덱스/권한이 유지되고 DDL 왕복이 한 번으로
+        줄어듭니다. 스키마 자체를 다시 만들어야 할 때만 `recreate=True`를 사용하세요.
+
         Parameters:
         - df (pd.DataFrame): 테이블의 기존 데이터를 대체할 데이터를 포함하는 Pandas DataFrame.
         - table (Table): 데이터를 대체할 SQLAlchemy Table 객체.
         - metadata (MetaData): 테이블 정의를 포함하는 SQLAlchemy MetaData 객체.
+        - recreate (bool): True이면 테이블을 DROP 후 재생성합니다 (기본값 False).
         """
         # 테이블이 존재하지 않으면 생성
         self.create_table(metadata=metadata)
 
-        # 기존 테이블 데이터 삭제
-        self.drop_table(table=table)
+        if recreate:
+            # 스키마 변경이 필요한 경우에만 테이블을 삭제 후 재생성
+            self.drop_table(table=table)
+        else:
+            # 기존 테이블 데이터만 삭제 (스키마/인덱스 유지)
+            with self.engine.begin() as connection:
+                connection.execute(text(f"TRUNCATE TABLE {self._quote(table.name)}"))
 
         # 새로운 데이터를 테이블에 삽입
         self.insert(df=df, table=table, metadata=metadata)
@@ -1,17 +1,63 @@
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 class WeatherApiClient:
     """
     OpenWeatherMap API 클라이언트를 사용하여 날씨 데이터를 가져오는 클래스입니다.
+
+    내부적으로 `requests.Session`을 유지하여 동일한 API 서버로의 TCP/TLS 연결을
+    재사용하므로 호출마다 새 연결을 맺는 비용(핸드셰이크)이 발생하지 않습니다.
     """
 
+    # (connect, read) 타임아웃 (초)
+    REQUEST_TIMEOUT = (3.05, 10)
+
+    # /group 엔드포인트가 한 번의 요청으로 허용하는 최대 도시 수
+    GROUP_MAX_CITIES = 20
+
     def __init__(self, api_key: str):
         self.base_url = "http://api.openweathermap.org/data/2.5"
         if api_key is None:
             raise Exception("API 키는 None으로 설정할 수 없습니다.")
         self.api_key = api_key
 
+        # 호출마다 URL 문자열과 공통 파라미터를 다시 만들지 않도록 캐시합니다.
+        self._weather_url = f"{self.base_url}/weather"
+        self._group_url = f"{self.base_url}/group"
+        self._base_params = {"appid": api_key, "units": "metric"}
+
+        # 도시 이름 -> OpenWeatherMap 도시 ID 캐시 (/group 호출에 사용)
+        self._city_ids: dict = {}
+
+        # 커넥션 풀 + 재시도 정책을 가진 세션을 생성하여 연결을 재사용합니다.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """
+        세션이 보유한 커넥션 풀의 소켓을 해제합니다.
+        """
+        self.session.close()
+
+    def __enter__(self) -> "WeatherApiClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def get_city(self, city_name: str, temperature_units: str = "metric") -> dict:
         """
         지정된 도시의 최신 날씨 데이터를 가져옵니다.
@@ -27,11 +73,103 @@ class WeatherApiClient:
         Raises:
         - Exception: API 요청이 실패한 경우 상태 코드와 응답 메시지와 함께 예외가 발생합니다.
         """
-        params = {"q": city_name, "units": temperature_units, "appid": self.api_key}
-        response = requests.get(f"{self.base_url}/weather", params=params)
+        params = {**self._base_params, "units": temperature_units, "q": city_name}
+        response = self.session.get(
+            self._weather_url, params=params, timeout=self.REQUEST_TIMEOUT
+        )
         if response.status_code == 200:
-            return response.json()
+            data = response.json()
+            self._city_ids[city_name] = data["id"]  # /group 호출용 ID 캐시
+            return data
         else:
             raise Exception(
                 f"Open Weather API에서 데이터를 추출하지 못했습니다. 상태 코드: {response.status_code}. 응답: {response.text}"
             )
+
+    def get_city_id(self, city_name: str) -> int:
+        """
+        도시 이름에 해당하는 OpenWeatherMap 도시 ID를 반환합니다.
+
+        최초 조회 시에만 `/weather` 호출로 ID를 알아내고 이후에는 캐시에서
+        바로 반환하므로, `/group` 호출을 위한 ID 변환 비용은 도시당 한 번입니다.
+
+        Parameters:
+        - city_name (str): ID를 조회할 도시 이름.
+
+        Returns:
+        - int: 해당 도시의 OpenWeatherMap 도시 ID.
+        """
+        city_id = self._city_ids.get(city_name)
+        if city_id is None:
+            city_id = self.get_city(city_name=city_name)["id"]
+        return city_id
+
+    def get_cities(self, city_ids: list, temperature_units: str = "metric") -> list:
+        """
+        여러 도시의 최신 날씨 데이터를 `/group` 엔드포인트로 한 번에 가져옵니다.
+
+        도시당 한 번씩 요청하는 대신 최대 20개 도시를 하나의 HTTP 왕복으로
+        조회하므로 소모되는 rate-limit 토큰과 왕복 횟수가 크게 줄어듭니다.
+        20개를 초과하면 자동으로 20개 단위로 나눠 요청합니다.
+
+        Parameters:
+        - city_ids (list): 조회할 OpenWeatherMap 도시 ID 목록.
+        - temperature_units (str): 온도 단위 (기본값은 'metric'으로 섭씨 기준).
+
+        Returns:
+        - list: 도시별 날씨 데이터 dict의 리스트 (`get_city` 응답과 동일한 구조).
+
+        Raises:
+        - Exception: API 요청이 실패한 경우 상태 코드와 응답 메시지와 함께 예외가 발생합니다.
+        """
+        results = []
+        for start in range(0, len(city_ids), self.GROUP_MAX_CITIES):
+            chunk = city_ids[start : start + self.GROUP_MAX_CITIES]
+            params = {
+                **self._base_params,
+                "units": temperature_units,
+                "id": ",".join(map(str, chunk)),
+            }
+            response = self.session.get(
+                self._group_url, params=params, timeout=self.REQUEST_TIMEOUT
+            )
+            if response.status_code == 200:
+                results.extend(response.json()["list"])
+            else:
+                raise Exception(
+                    f"Open Weather API에서 데이터를 추출하지 못했습니다. 상태 코드: {response.status_code}. 응답: {response.text}"
+                )
+        return results
+
+    async def get_city_async(
+        self,
+        session: aiohttp.ClientSession,
+        city_name: str,
+        temperature_units: str = "metric",
+    ) -> dict:
+        """
+        지정된 도시의 최신 날씨 데이터를 비동기로 가져옵니다.
+
+        여러 도시를 조회할 때 `asyncio.gather`로 동시에 요청을 보내면
+        전체 대기 시간이 도시 수에 비례하지 않고 가장 느린 응답 시간으로 수렴합니다.
+
+        Parameters:
+        - session (aiohttp.ClientSession): 재사용할 aiohttp 세션 (커넥션 풀 공유).
+        - city_name (str): 날씨 정보를 조회할 도시 이름.
+        - temperature_units (str): 온도 단위 (기본값은 'metric'으로 섭씨 기준).
+
+        Returns:
+        - dict: 요청한 도시의 날씨 데이터가 포함된 JSON 응답을 반환합니다.
+
+        Raises:
+        - Exception: API 요청이 실패한 경우 상태 코드와 응답 메시지와 함께 예외가 발생합니다.
+        """
+        params = {**self._base_params, "units": temperature_units, "q": city_name}
+        async with session.get(self._weather_url, params=params) as response:
+            if response.status == 200:
+                return await response.json()
+            else:
+                text = await response.text()
+                raise Exception(
+                    f"Open Weather API에서 데이터를 추출하지 못했습니다. 상태 코드: {response.status}. 응답: {text}"
+                )
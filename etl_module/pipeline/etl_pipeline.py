@@ -1,26 +1,91 @@
+import asyncio
 import os
 from datetime import datetime
+from functools import lru_cache
 from dotenv import load_dotenv
 from etl_module.connectors.weather_api import WeatherApiClient
 from etl_module.connectors.mysql import MySqlClient
-from etl_module.assets.weather import extract_weather, transform_weather, load_weather
+from etl_module.assets.weather import (
+    extract_weather_async,
+    transform_weather,
+    load_weather,
+)
 from loguru import logger
-import schedule
 import yaml
-import time
 
-# pip install schedule
 # pip install pyyaml
 # pip install loguru
 
 
-def main(config):
+@lru_cache(maxsize=1)
+def get_clients():
+    """
+    WeatherApiClient와 MySqlClient를 생성하여 반환합니다.
+
+    `lru_cache`로 메모이즈되므로 스케줄러가 매 주기마다 호출해도 클라이언트는
+    프로세스당 한 번만 생성됩니다. 덕분에 SQLAlchemy 커넥션 풀과 requests
+    세션이 실행 사이에 유지되어, 주기마다 엔진/풀을 새로 만드는 비용
+    (DNS 조회, TCP/TLS 핸드셰이크)이 사라집니다.
+
+    Returns:
+    - tuple: (WeatherApiClient, MySqlClient)
+
+    Raises:
+    - ValueError: 필요한 환경 변수가 누락된 경우.
+    """
+    load_dotenv()
+
+    API_KEY = os.environ.get("API_KEY")
+    DB_SERVER_HOST = os.environ.get("DB_SERVER_HOST")
+    DB_USERNAME = os.environ.get("DB_USERNAME")
+    DB_PASSWORD = os.environ.get("DB_PASSWORD")
+    DB_DATABASE = os.environ.get("DB_DATABASE")
+    DB_PORT = os.environ.get("DB_PORT")
+
+    if not all(
+        [API_KEY, DB_SERVER_HOST, DB_USERNAME, DB_PASSWORD, DB_DATABASE, DB_PORT]
+    ):
+        # 누락된 변수들 확인
+        missing_vars = [
+            var
+            for var, value in [
+                ("API_KEY", API_KEY),
+                ("DB_SERVER_HOST", DB_SERVER_HOST),
+                ("DB_USERNAME", DB_USERNAME),
+                ("DB_PASSWORD", DB_PASSWORD),
+                ("DB_DATABASE", DB_DATABASE),
+                ("DB_PORT", DB_PORT),
+            ]
+            if value is None
+        ]
+        error_message = f"누락된 환경 변수: {', '.join(missing_vars)}"
+        logger.error(error_message)
+        raise ValueError(error_message)  # 누락된 환경 변수가 있으면 예외를 발생시킴
+
+    logger.info("환경 변수를 성공적으로 로드했습니다.")
+
+    weather_api_client = WeatherApiClient(api_key=API_KEY)
+    logger.info("WeatherApiClient가 초기화되었습니다.")
+
+    my_sql_client = MySqlClient(
+        server_name=DB_SERVER_HOST,
+        database_name=DB_DATABASE,
+        username=DB_USERNAME,
+        password=DB_PASSWORD,
+        port=DB_PORT,
+    )
+    logger.info("MySqlClient가 초기화되었습니다.")
+
+    return weather_api_client, my_sql_client
+
+
+async def main_async(config):
     """
     main 함수는 전체 ETL 프로세스를 실행합니다.
 
-    1. 환경 변수를 로드하여 Weather API와 MySQL 데이터베이스 연결에 필요한 정보를 가져옵니다.
-    2. WeatherApiClient와 MySqlClient 객체를 생성합니다.
-    3. ETL 프로세스를 순차적으로 수행합니다:
+    1. 환경 변수 기반으로 생성된 WeatherApiClient와 MySqlClient를 가져옵니다.
+       (클라이언트는 메모이즈되어 실행 사이에 재사용됩니다.)
+    2. ETL 프로세스를 순차적으로 수행합니다:
        - 데이터를 Weather API에서 추출합니다.
        - 추출된 데이터를 변환하여 필요한 형태로 가공합니다.
        - 가공된 데이터를 MySQL 데이터베이스에 적재합니다.
@@ -31,54 +96,13 @@ def main(config):
     logger.add(log_filename)
 
     logger.info("ETL 프로세스를 시작합니다.")
-    load_dotenv()
 
     try:
-
-        API_KEY = os.environ.get("API_KEY")
-        DB_SERVER_HOST = os.environ.get("DB_SERVER_HOST")
-        DB_USERNAME = os.environ.get("DB_USERNAME")
-        DB_PASSWORD = os.environ.get("DB_PASSWORD")
-        DB_DATABASE = os.environ.get("DB_DATABASE")
-        DB_PORT = os.environ.get("DB_PORT")
-
-        if not all(
-            [API_KEY, DB_SERVER_HOST, DB_USERNAME, DB_PASSWORD, DB_DATABASE, DB_PORT]
-        ):
-            # 누락된 변수들 확인
-            missing_vars = [
-                var
-                for var, value in [
-                    ("API_KEY", API_KEY),
-                    ("DB_SERVER_HOST", DB_SERVER_HOST),
-                    ("DB_USERNAME", DB_USERNAME),
-                    ("DB_PASSWORD", DB_PASSWORD),
-                    ("DB_DATABASE", DB_DATABASE),
-                    ("DB_PORT", DB_PORT),
-                ]
-                if value is None
-            ]
-            error_message = f"누락된 환경 변수: {', '.join(missing_vars)}"
-            logger.error(error_message)
-            raise ValueError(error_message)  # 누락된 환경 변수가 있으면 예외를 발생시킴
-
-        logger.info("환경 변수를 성공적으로 로드했습니다.")
-
-        weather_api_client = WeatherApiClient(api_key=API_KEY)
-        logger.info("WeatherApiClient가 초기화되었습니다.")
-
-        my_sql_client = MySqlClient(
-            server_name=DB_SERVER_HOST,
-            database_name=DB_DATABASE,
-            username=DB_USERNAME,
-            password=DB_PASSWORD,
-            port=DB_PORT,
-        )
-        logger.info("MySqlClient가 초기화되었습니다.")
+        weather_api_client, my_sql_client = get_clients()
 
         # ETL 실행
         logger.info("Weather API에서 데이터 추출을 시작합니다.")
-        df = extract_weather(
+        df = await extract_weather_async(
             weather_api_client=weather_api_client, cities=config.get("cities")
         )
         logger.info(
@@ -99,6 +123,20 @@ def main(config):
         logger.error(f"ETL 프로세스 중 오류가 발생했습니다. 오류: {e}")
 
 
+async def scheduler_loop(config):
+    """
+    설정된 주기(run_minutes)마다 ETL 프로세스를 실행하는 비동기 스케줄러입니다.
+
+    `asyncio.sleep`으로 다음 실행 시각까지 이벤트 루프를 양보하므로,
+    5초 간격으로 깨어나 폴링하던 기존 `schedule.run_pending()` 루프와 달리
+    불필요한 wake-up과 최대 5초의 실행 시점 오차가 없습니다.
+    """
+    interval_seconds = config.get("run_minutes") * 60
+    while True:
+        await asyncio.sleep(interval_seconds)
+        await main_async(config)
+
+
 if __name__ == "__main__":
 
     # get config variables
@@ -111,9 +149,5 @@ if __name__ == "__main__":
     log_folder_path = config.get("log_folder_path")
     os.makedirs(log_folder_path, exist_ok=True)
 
-    # 스케줄러 생성
-    schedule.every(config.get("run_minutes")).minutes.do(main, config=config)
-
-    while True:
-        schedule.run_pending()
-        time.sleep(5)
+    # 이벤트 루프 기반 스케줄러 실행
+    asyncio.run(scheduler_loop(config))